@@ -23,25 +23,143 @@ Usage:
 
     # Execute drop for specific schema
     python scripts/drop_tables.py --schema my_schema --execute
+
+    # Execute drops using 16 concurrent connections
+    python scripts/drop_tables.py --execute --concurrency 16
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import math
 import os
+import re
 import sys
-from typing import Optional
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
 
-import trino
+# trino (and requests, which it pulls in) is slow to import, so it is only
+# imported where a connection is made or its exceptions are handled. This
+# keeps --help and single-table dry runs fast.
+if TYPE_CHECKING:
+    import trino
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
+# Drops are independent, network-bound statements, so they can be issued in
+# parallel. Cap the pool size to avoid flooding the shared Trino cluster.
+DEFAULT_CONCURRENCY = 8
+MAX_CONCURRENCY = 32
+
+# Number of drops handed to a worker at a time
+DEFAULT_BATCH_SIZE = 50
+
+# Number of tables listed before asking for confirmation of a prod drop
+PREVIEW_COUNT = 10
+
+# Individual drops are only logged with --verbose; progress is logged at INFO
+# every this many drops, and failed drops are summarized once at the end
+DEFAULT_LOG_EVERY = 100
+MAX_LOGGED_FAILURES = 20
+
+# Equivalent to SHOW SCHEMAS ... LIKE, but parameterized to prevent SQL
+# injection. Parameters: catalog, schema pattern.
+LIST_SCHEMAS_QUERY = """
+    select
+        table_schem
+    from
+        system.jdbc.schemas
+    where
+        table_catalog = ?
+        and table_schem like ?
+    order by
+        table_schem
+"""
+
+# Schemas listed per IN query when listing several schemas
+MAX_SCHEMAS_PER_QUERY = 200
+
+# Listings of single schemas are cached on disk for repeated runs
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "dune_drop_tables"
+DEFAULT_CACHE_TTL = 300
+
+# Identifiers accepted by quote_identifier
+IDENTIFIER_PATTERN = re.compile(r"\A[A-Za-z0-9_]+\Z")
+
+# Formatted with the quoted catalog, schema and table name
+DROP_TABLE_TEMPLATE = "drop table if exists {}.{}.{}"
+DROP_VIEW_TEMPLATE = "drop view if exists {}.{}.{}"
+DROP_MATERIALIZED_VIEW_TEMPLATE = "drop materialized view if exists {}.{}.{}"
+
+# Trino rejects DROP TABLE on a view or materialized view with an error
+# containing one of these messages; map each to the statement to retry with
+VIEW_FALLBACK_TEMPLATES = {
+    "but a view with that name exists": DROP_VIEW_TEMPLATE,
+    "but a materialized view with that name exists": DROP_MATERIALIZED_VIEW_TEMPLATE,
+}
+
+# (connect, read) timeouts in seconds for HTTP requests to Trino
+REQUEST_TIMEOUT = (10, 300)
+
+# Trino errors caused by transient cluster conditions; statements failing
+# with these are reissued once. Every statement this script runs is a
+# metadata read or a DROP ... IF EXISTS, so reissuing is safe. HTTP-level
+# failures (429/502/503/504, connection errors) are already retried by the
+# trino client itself, so they are not retried again here.
+RETRYABLE_ERROR_NAMES = frozenset({
+    "CLUSTER_OUT_OF_MEMORY",
+    "NO_NODES_AVAILABLE",
+    "PAGE_TRANSPORT_TIMEOUT",
+    "REMOTE_HOST_GONE",
+    "REMOTE_TASK_ERROR",
+    "SERVER_SHUTTING_DOWN",
+    "TOO_MANY_REQUESTS_FAILED",
+})
+
+
+@dataclass
+class TableList:
+    """
+    Materialized listing of tables and views, stored as parallel lists.
+
+    Keeping one list per column avoids allocating a container per table,
+    which matters for cleanups of many thousands of objects. Iterating
+    yields (schema, table name) pairs, the same shape the listing
+    functions yield.
+    """
+
+    schemas: list = field(default_factory=list)
+    names: list = field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "TableList":
+        """Build a TableList from (schema, table name) pairs."""
+        tables = cls()
+        for schema, name in rows:
+            tables.append(schema, name)
+        return tables
+
+    def append(self, schema: str, name: str):
+        """Add a table to the listing."""
+        self.schemas.append(schema)
+        self.names.append(name)
+
+    def __len__(self) -> int:
+        return len(self.schemas)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return zip(self.schemas, self.names)
+
 
 class DuneTrinoConnection:
     """Manages connection to Dune Trino API endpoint."""
@@ -52,6 +170,7 @@ class DuneTrinoConnection:
         host: str = "trino.api.dune.com",
         port: int = 443,
         catalog: str = "dune",
+        extra_session_properties: Optional[dict] = None,
     ):
         """
         Initialize Dune Trino connection.
@@ -61,6 +180,8 @@ class DuneTrinoConnection:
             host: Trino host endpoint
             port: Trino port
             catalog: Trino catalog
+            extra_session_properties: Additional Trino session properties for
+                every connection (transformations is always 'true')
         """
         self.api_key = api_key or os.getenv("DUNE_API_KEY")
         if not self.api_key:
@@ -71,9 +192,15 @@ class DuneTrinoConnection:
         self.host = host
         self.port = port
         self.catalog = catalog
+        # Dune requires transformations for DDL, so it cannot be overridden
+        self.session_properties = {**(extra_session_properties or {}), "transformations": "true"}
         self.connection = None
+        self.worker_connections = []
+        self._lock = threading.Lock()
 
         logger.info(f"Initialized Dune Trino connection config (host={host}, catalog={catalog})")
+        if extra_session_properties:
+            logger.info(f"Session properties: {self.session_properties}")
 
     def connect(self) -> trino.dbapi.Connection:
         """
@@ -84,90 +211,236 @@ class DuneTrinoConnection:
         """
         logger.info("Connecting to Dune Trino API...")
 
-        self.connection = trino.dbapi.connect(
+        self.connection = self._open_connection()
+
+        logger.info("Successfully connected to Dune Trino API")
+        return self.connection
+
+    def new_connection(self) -> trino.dbapi.Connection:
+        """
+        Open an additional connection for use by a worker thread.
+
+        trino.dbapi.Connection is not safe to share between threads, so each
+        worker gets its own. Worker connections are closed by close().
+
+        Returns:
+            trino.dbapi.Connection: Active Trino connection
+        """
+        connection = self._open_connection()
+        with self._lock:
+            self.worker_connections.append(connection)
+        logger.debug("Opened worker connection to Dune Trino API")
+        return connection
+
+    def _open_connection(self) -> trino.dbapi.Connection:
+        """Open a new connection using this instance's configuration."""
+        import trino
+
+        return trino.dbapi.connect(
             host=self.host,
             port=self.port,
             user="dune",  # Always 'dune' for Dune API
             catalog=self.catalog,
             http_scheme="https",
             auth=trino.auth.BasicAuthentication("dune", self.api_key),
-            session_properties={"transformations": "true"},
+            session_properties=self.session_properties,
+            request_timeout=REQUEST_TIMEOUT,
         )
 
-        logger.info("Successfully connected to Dune Trino API")
-        return self.connection
-
     def close(self):
-        """Close the Trino connection."""
+        """Close the Trino connection and any worker connections."""
+        with self._lock:
+            worker_connections, self.worker_connections = self.worker_connections, []
+        for connection in worker_connections:
+            connection.close()
         if self.connection:
             self.connection.close()
             logger.info("Connection closed")
 
 
-def list_tables_by_pattern(
-    connection: trino.dbapi.Connection,
-    schema_pattern: str,
-    catalog: str = "dune",
+def execute_with_retry(
+    cursor: trino.dbapi.Cursor,
+    sql: str,
+    params: Optional[tuple] = None,
 ) -> list:
     """
-    List all tables matching a schema pattern.
+    Execute a statement and fetch its results, reissuing it once on a transient error.
 
     Args:
-        connection: Active Trino connection
-        schema_pattern: Schema pattern to match (e.g., 'my_team__tmp_%' for LIKE matching)
-        catalog: Catalog name (default: 'dune')
+        cursor: Cursor to execute on
+        sql: SQL statement
+        params: Query parameters, if any
 
     Returns:
-        list: List of dicts with schema, table name, and type
+        list: All result rows
+    """
+    import trino
+
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    except trino.exceptions.TrinoQueryError as e:
+        if e.error_name not in RETRYABLE_ERROR_NAMES:
+            raise
+        logger.warning(f"Transient error, retrying once: {e}")
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def build_list_tables_query(
+    *,
+    catalog: str = "dune",
+    schema_eq: Optional[str] = None,
+    schema_like: Optional[str] = None,
+    schema_in: Optional[list] = None,
+    table_eq: Optional[str] = None,
+) -> tuple:
     """
-    cursor = connection.cursor()
+    Build the parameterized listing query for the supplied filters.
+
+    Args:
+        catalog: Catalog name (default: 'dune')
+        schema_eq: Exact schema name
+        schema_like: Schema pattern for LIKE matching (e.g., 'my_team__tmp_%')
+        schema_in: Non-empty list of exact schema names
+        table_eq: Exact table name
 
-    # Use parameterized query to prevent SQL injection
-    query = """
+    Returns:
+        tuple: Query string and tuple of parameters
+    """
+    # Build a parameterized query to prevent SQL injection
+    predicates = ["table_cat = ?"]
+    params = [catalog]
+    if schema_eq is not None:
+        predicates.append("table_schem = ?")
+        params.append(schema_eq)
+    if schema_like is not None:
+        predicates.append("table_schem like ?")
+        params.append(schema_like)
+    if schema_in is not None:
+        placeholders = ", ".join("?" for _ in schema_in)
+        predicates.append(f"table_schem in ({placeholders})")
+        params.extend(schema_in)
+    if table_eq is not None:
+        predicates.append("table_name = ?")
+        params.append(table_eq)
+
+    # system.jdbc.tables pushes the catalog and schema filters down to the
+    # connector instead of materializing the information_schema view
+    where_clause = "\n            and ".join(predicates)
+    query = f"""
         select
-            table_schema
+            table_schem
             , table_name
-            , table_type
         from
-            dune.information_schema.tables
+            system.jdbc.tables
         where
-            table_catalog = ?
-            and table_schema like ?
+            {where_clause}
         order by
-            table_schema
+            table_schem
             , table_name
     """
+    return query, tuple(params)
+
+
+def list_tables(
+    connection: trino.dbapi.Connection,
+    *,
+    catalog: str = "dune",
+    schema_eq: Optional[str] = None,
+    schema_like: Optional[str] = None,
+    schema_in: Optional[list] = None,
+    table_eq: Optional[str] = None,
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> Iterator[tuple]:
+    """
+    List tables and views matching the supplied filters in a single query.
+
+    Only the filters that are supplied are added to the WHERE clause, so one
+    round trip can cover an exact schema, a schema pattern, a list of schemas
+    or a specific table. The query runs when iteration starts, and its whole
+    result is read into a TableList before the first row is yielded. A
+    consumer that is slow (such as drop_tables) cannot then hold the query
+    open on the server, where Trino would abandon it once the client stops
+    polling for longer than its client timeout.
+
+    Args:
+        connection: Active Trino connection
+        catalog: Catalog name (default: 'dune')
+        schema_eq: Exact schema name
+        schema_like: Schema pattern for LIKE matching (e.g., 'my_team__tmp_%')
+        schema_in: List of exact schema names
+        table_eq: Exact table name
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
+
+    Yields:
+        tuple: Schema and table name
+    """
+    if schema_in is not None and not schema_in:
+        return
+
+    query, params = build_list_tables_query(
+        catalog=catalog,
+        schema_eq=schema_eq,
+        schema_like=schema_like,
+        schema_in=schema_in,
+        table_eq=table_eq,
+    )
 
-    logger.info(f"Querying tables matching schema pattern: {schema_pattern}")
     logger.debug(f"Query: {query}")
-    logger.debug(f"Parameters: catalog={catalog}, schema_pattern={schema_pattern}")
+    logger.debug(f"Parameters: {params}")
 
+    owns_cursor = cursor is None
+    if owns_cursor:
+        cursor = connection.cursor()
     try:
-        cursor.execute(query, (catalog, schema_pattern))
-        results = cursor.fetchall()
-
-        tables = []
-        for row in results:
-            schema_name, table_name, table_type = row
-            tables.append({
-                "schema": schema_name,
-                "name": table_name,
-                "type": table_type,
-            })
-
-        return tables
+        start_time = time.perf_counter()
+        tables = TableList.from_rows(execute_with_retry(cursor, query, params))
+        logger.debug(f"Listed {len(tables)} table(s) in {time.perf_counter() - start_time:.2f}s")
     except Exception as e:
         logger.error(f"Error querying tables: {e}")
         raise
     finally:
-        cursor.close()
+        if owns_cursor:
+            cursor.close()
+
+    yield from tables
+
+
+def list_tables_by_pattern(
+    connection: trino.dbapi.Connection,
+    schema_pattern: str,
+    catalog: str = "dune",
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> Iterator[tuple]:
+    """
+    List all tables matching a schema pattern.
+
+    The matching schema names are looked up first, then their tables are
+    listed with an IN filter.
+
+    Args:
+        connection: Active Trino connection
+        schema_pattern: Schema pattern to match (e.g., 'my_team__tmp_%' for LIKE matching)
+        catalog: Catalog name (default: 'dune')
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
+
+    Returns:
+        Iterator[tuple]: (schema, table name) pairs
+    """
+    # Resolve the pattern to exact schema names first, so the table listing
+    # filters on an IN list rather than a LIKE over every schema
+    schemas = list_schemas_by_pattern(connection, schema_pattern, catalog, cursor)
+    logger.info(f"Schema pattern {schema_pattern} matched {len(schemas)} schema(s)")
+    return list_tables_multi(connection, schemas, catalog, cursor)
 
 
 def list_tables_by_schema(
     connection: trino.dbapi.Connection,
     schema: str,
     catalog: str = "dune",
-) -> list:
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> Iterator[tuple]:
     """
     List all tables in a specific schema using exact equality match.
 
@@ -175,51 +448,93 @@ def list_tables_by_schema(
         connection: Active Trino connection
         schema: Exact schema name (no pattern matching)
         catalog: Catalog name (default: 'dune')
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
 
     Returns:
-        list: List of dicts with schema, table name, and type
+        Iterator[tuple]: (schema, table name) pairs
     """
-    cursor = connection.cursor()
+    logger.info(f"Querying tables in schema: {schema}")
+    return list_tables(connection, catalog=catalog, schema_eq=schema, cursor=cursor)
 
-    # Use parameterized query with exact equality (not LIKE)
-    query = """
-        select
-            table_schema
-            , table_name
-            , table_type
-        from
-            dune.information_schema.tables
-        where
-            table_catalog = ?
-            and table_schema = ?
-        order by
-            table_schema
-            , table_name
+
+def list_schemas_by_pattern(
+    connection: trino.dbapi.Connection,
+    schema_pattern: str,
+    catalog: str = "dune",
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> list:
     """
+    List schema names matching a pattern.
 
-    logger.info(f"Querying tables in schema: {schema}")
+    Args:
+        connection: Active Trino connection
+        schema_pattern: Schema pattern to match (e.g., 'my_team__tmp_%' for LIKE matching)
+        catalog: Catalog name (default: 'dune')
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
+
+    Returns:
+        list: Matching schema names
+    """
+    query = LIST_SCHEMAS_QUERY
+
+    logger.info(f"Querying schemas matching pattern: {schema_pattern}")
     logger.debug(f"Query: {query}")
-    logger.debug(f"Parameters: catalog={catalog}, schema={schema}")
+    logger.debug(f"Parameters: catalog={catalog}, schema_pattern={schema_pattern}")
 
+    owns_cursor = cursor is None
+    if owns_cursor:
+        cursor = connection.cursor()
     try:
-        cursor.execute(query, (catalog, schema))
-        results = cursor.fetchall()
-
-        tables = []
-        for row in results:
-            schema_name, table_name, table_type = row
-            tables.append({
-                "schema": schema_name,
-                "name": table_name,
-                "type": table_type,
-            })
-
-        return tables
+        return [row[0] for row in execute_with_retry(cursor, query, (catalog, schema_pattern))]
     except Exception as e:
-        logger.error(f"Error querying tables: {e}")
+        logger.error(f"Error querying schemas: {e}")
         raise
     finally:
-        cursor.close()
+        if owns_cursor:
+            cursor.close()
+
+
+def list_tables_multi(
+    connection: trino.dbapi.Connection,
+    schemas: list,
+    catalog: str = "dune",
+    cursor: Optional[trino.dbapi.Cursor] = None,
+    cache_ttl: Optional[int] = None,
+) -> Iterator[tuple]:
+    """
+    List all tables in several schemas with IN queries.
+
+    Schemas are queried MAX_SCHEMAS_PER_QUERY at a time to keep each
+    statement to a reasonable size.
+
+    Args:
+        connection: Active Trino connection
+        schemas: Exact schema names (no pattern matching)
+        catalog: Catalog name (default: 'dune')
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
+        cache_ttl: If set, reuse an on-disk listing of the same schemas younger
+            than this many seconds, and cache a fresh listing once it has been
+            fully read
+
+    Returns:
+        Iterator[tuple]: (schema, table name) pairs
+    """
+    # Exact names cannot match schemas created later, so the listing is safe
+    # to reuse; the key ignores the order the schemas were given in
+    if cache_ttl:
+        return cached_listing(
+            lambda: list_tables_multi(connection, schemas, catalog, cursor),
+            catalog,
+            f"in:{','.join(sorted(set(schemas)))}",
+            cache_ttl,
+        )
+
+    logger.info(f"Querying tables in {len(schemas)} schema(s)")
+    logger.debug(f"Schemas: {', '.join(schemas)}")
+    return itertools.chain.from_iterable(
+        list_tables(connection, catalog=catalog, schema_in=schema_chunk, cursor=cursor)
+        for schema_chunk in chunked(schemas, MAX_SCHEMAS_PER_QUERY)
+    )
 
 
 def list_specific_table(
@@ -227,7 +542,8 @@ def list_specific_table(
     schema: str,
     table_name: str,
     catalog: str = "dune",
-) -> list:
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> Iterator[tuple]:
     """
     List a specific table in a schema.
 
@@ -236,49 +552,98 @@ def list_specific_table(
         schema: Schema name
         table_name: Table name
         catalog: Catalog name (default: 'dune')
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
 
     Returns:
-        list: List with single dict containing table info, or empty list if not found
+        Iterator[tuple]: Single (schema, table name) pair, or nothing if not found
     """
-    cursor = connection.cursor()
+    logger.info(f"Querying table: {catalog}.{schema}.{table_name}")
+    return list_tables(connection, catalog=catalog, schema_eq=schema, table_eq=table_name, cursor=cursor)
 
-    # Use parameterized query to prevent SQL injection
-    query = """
-        select
-            table_schema
-            , table_name
-            , table_type
-        from
-            dune.information_schema.tables
-        where
-            table_catalog = ?
-            and table_schema = ?
-            and table_name = ?
+
+def cached_listing(
+    query_tables: Callable[[], Iterator[tuple]],
+    catalog: str,
+    key: str,
+    ttl: int,
+) -> Iterator[tuple]:
     """
+    Return a cached listing if one is fresh, otherwise query and cache it.
 
-    logger.info(f"Querying table: {catalog}.{schema}.{table_name}")
-    logger.debug(f"Query: {query}")
-    logger.debug(f"Parameters: catalog={catalog}, schema={schema}, table_name={table_name}")
+    Args:
+        query_tables: Callable running the uncached listing query
+        catalog: Catalog name
+        key: Cache key describing the listing filter
+        ttl: Maximum age of a cached listing in seconds
 
-    try:
-        cursor.execute(query, (catalog, schema, table_name))
-        results = cursor.fetchall()
-
-        tables = []
-        for row in results:
-            schema_name, table_name_result, table_type = row
-            tables.append({
-                "schema": schema_name,
-                "name": table_name_result,
-                "type": table_type,
-            })
+    Returns:
+        Iterator[tuple]: (schema, table name) pairs
+    """
+    cached_tables = read_cached_tables(catalog, key, ttl)
+    if cached_tables is not None:
+        logger.info(f"Using cached listing for {key} ({len(cached_tables)} table(s))")
+        return iter(cached_tables)
+    return cache_when_read(query_tables(), catalog, key)
 
-        return tables
-    except Exception as e:
-        logger.error(f"Error querying table: {e}")
-        raise
-    finally:
-        cursor.close()
+
+def cache_path(catalog: str, key: str) -> Path:
+    """Return the cache file path for a listing."""
+    key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{catalog}__{key_hash}.json"
+
+
+def read_cached_tables(catalog: str, key: str, ttl: int) -> Optional[TableList]:
+    """
+    Read a cached listing if it is younger than ttl seconds.
+
+    Returns:
+        TableList: Cached tables, or None if missing, expired or unreadable
+    """
+    try:
+        cached = json.loads(cache_path(catalog, key).read_text())
+        if cached["key"] != key or time.time() - cached["ts"] >= ttl:
+            return None
+        if len(cached["schemas"]) != len(cached["names"]):
+            return None
+        return TableList(schemas=cached["schemas"], names=cached["names"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_cached_tables(catalog: str, key: str, tables: TableList):
+    """Write a listing to the cache. Failures are logged and ignored."""
+    path = cache_path(catalog, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({
+            "ts": time.time(),
+            "key": key,
+            "schemas": tables.schemas,
+            "names": tables.names,
+        }))
+        # Replace atomically so concurrent runs never read a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write listing cache {path}: {e}")
+
+
+def invalidate_cached_tables(catalog: str):
+    """Remove all cached listings for a catalog, e.g. after tables were dropped."""
+    for path in CACHE_DIR.glob(f"{catalog}__*.json"):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not remove listing cache {path}: {e}")
+
+
+def cache_when_read(tables: Iterable[tuple], catalog: str, key: str) -> Iterator[tuple]:
+    """Pass tables through, caching the listing once it has been fully read."""
+    seen = TableList()
+    for schema, name in tables:
+        seen.append(schema, name)
+        yield schema, name
+    write_cached_tables(catalog, key, seen)
 
 
 def quote_identifier(identifier: str) -> str:
@@ -286,7 +651,8 @@ def quote_identifier(identifier: str) -> str:
     Quote a SQL identifier to prevent SQL injection in DDL statements.
     
     In Trino, identifiers can be quoted with double quotes.
-    This function validates and quotes identifiers safely.
+    This function validates and quotes identifiers safely. Only ASCII
+    letters, digits and underscores are accepted.
     
     Args:
         identifier: SQL identifier to quote
@@ -295,129 +661,490 @@ def quote_identifier(identifier: str) -> str:
         str: Quoted identifier
         
     Raises:
-        ValueError: If identifier contains quotes or is invalid
+        ValueError: If identifier is empty or contains any other character
     """
-    # Validate: no double quotes allowed (would break quoting)
-    if '"' in identifier:
-        raise ValueError(f"Invalid identifier: contains double quotes: {identifier}")
+    # Validate against a whitelist. isascii() + isidentifier() is a fast C-level
+    # check that accepts most names; the regex also allows a leading digit.
+    if not (identifier.isascii() and identifier.isidentifier()) and not IDENTIFIER_PATTERN.match(identifier):
+        raise ValueError(f"Invalid identifier: only letters, digits and underscores are allowed: {identifier!r}")
     
     # Quote the identifier
     return f'"{identifier}"'
 
 
+# Catalog and schema names repeat across every drop in a run, so cache them
+quote_identifier_cached = functools.lru_cache(maxsize=256)(quote_identifier)
+
+
+def view_fallback_template(error_message: Optional[str]) -> Optional[str]:
+    """
+    Return the DROP template to retry with when DROP TABLE hit a view.
+
+    Args:
+        error_message: Message of the Trino error raised by DROP TABLE
+
+    Returns:
+        str: DROP VIEW or DROP MATERIALIZED VIEW template, or None if the
+            error is not about a view
+    """
+    for message, template in VIEW_FALLBACK_TEMPLATES.items():
+        if message in (error_message or ""):
+            return template
+    return None
+
+
 def drop_table_or_view(
     connection: trino.dbapi.Connection,
     schema: str,
     table_name: str,
-    table_type: str,
     catalog: str = "dune",
     dry_run: bool = True,
-) -> bool:
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> Optional[str]:
     """
     Drop a table or view from the specified schema.
 
+    DROP TABLE is issued first and retried as DROP VIEW or DROP MATERIALIZED
+    VIEW if Trino reports that the object is one. This avoids having to look
+    up the object type beforehand.
+
     Args:
         connection: Active Trino connection
         schema: Schema name
         table_name: Name of the table/view to drop
-        table_type: Type of object ('BASE TABLE' or 'VIEW')
         catalog: Catalog name (default: 'dune')
         dry_run: If True, only log the command without executing
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
 
     Returns:
-        bool: True if successful (or dry run), False otherwise
+        str: Error message if the drop failed, None if successful (or dry run)
     """
     try:
         # Quote identifiers to prevent SQL injection in DDL statements
-        quoted_catalog = quote_identifier(catalog)
-        quoted_schema = quote_identifier(schema)
-        quoted_table = quote_identifier(table_name)
-        
-        # Determine if this is a table or view
-        if table_type == "VIEW":
-            drop_statement = f"drop view if exists {quoted_catalog}.{quoted_schema}.{quoted_table}"
-        else:  # BASE TABLE or other types
-            drop_statement = f"drop table if exists {quoted_catalog}.{quoted_schema}.{quoted_table}"
+        quoted_names = (
+            quote_identifier_cached(catalog),
+            quote_identifier_cached(schema),
+            quote_identifier(table_name),
+        )
     except ValueError as e:
-        logger.error(f"✗ Invalid identifier for {schema}.{table_name}: {e}")
-        return False
-
-    # Always log the drop command
-    logger.info(f"DROP: {drop_statement}")
+        return str(e)
+    drop_statement = DROP_TABLE_TEMPLATE.format(*quoted_names)
 
+    # Dry runs always show the drop command. Otherwise per-drop lines are
+    # debug only, and the f-strings are skipped when they would be discarded.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     if dry_run:
+        logger.info(f"DROP: {drop_statement}")
         logger.debug("Dry run mode - command not executed")
-        return True
+        return None
+    if debug_enabled:
+        logger.debug(f"DROP: {drop_statement}")
+
+    import trino
 
     # Execute the drop command
-    cursor = connection.cursor()
+    owns_cursor = cursor is None
+    if owns_cursor:
+        cursor = connection.cursor()
     try:
-        cursor.execute(drop_statement)
-        logger.info(f"✓ Successfully dropped: {schema}.{table_name}")
-        return True
+        try:
+            # Drains the result so the statement has completed before the next one
+            execute_with_retry(cursor, drop_statement)
+        except trino.exceptions.TrinoUserError as e:
+            fallback_template = view_fallback_template(e.message)
+            if fallback_template is None:
+                raise
+            drop_statement = fallback_template.format(*quoted_names)
+            if debug_enabled:
+                logger.debug(f"DROP: {drop_statement}")
+            execute_with_retry(cursor, drop_statement)
+        if debug_enabled:
+            logger.debug(f"✓ Successfully dropped: {schema}.{table_name}")
+        return None
     except Exception as e:
-        logger.error(f"✗ Error dropping {schema}.{table_name}: {e}")
-        return False
+        # Failures are summarized by the caller, which logs the message
+        if debug_enabled:
+            logger.debug(f"✗ Error dropping {schema}.{table_name}: {e}")
+        return str(e)
+    finally:
+        if owns_cursor:
+            cursor.close()
+
+
+def drop_tables_batched(
+    connection: trino.dbapi.Connection,
+    tables: TableList,
+    catalog: str = "dune",
+    dry_run: bool = True,
+    cursor: Optional[trino.dbapi.Cursor] = None,
+) -> dict:
+    """
+    Drop a batch of tables and views over a single cursor.
+
+    Trino's DB-API client accepts only one statement per execute() call, so
+    the statements are still sent one at a time, but they share a cursor and
+    each result is drained before the next statement is issued. A failed drop
+    is counted and the rest of the batch continues.
+
+    Args:
+        connection: Active Trino connection
+        tables: Tables and views to drop
+        catalog: Catalog name (default: 'dune')
+        dry_run: If True, only log the commands without executing
+        cursor: Cursor to execute on (a new one is opened and closed if omitted)
+
+    Returns:
+        dict: Summary with counts of successful and failed drops, and
+        (name, error message) pairs for the failed tables
+    """
+    success_count = 0
+    failed_tables = []
+
+    owns_cursor = cursor is None and not dry_run
+    if owns_cursor:
+        cursor = connection.cursor()
+    try:
+        for schema, table_name in zip(tables.schemas, tables.names):
+            error = drop_table_or_view(
+                connection,
+                schema,
+                table_name,
+                catalog=catalog,
+                dry_run=dry_run,
+                cursor=cursor,
+            )
+            if error is None:
+                success_count += 1
+            else:
+                failed_tables.append((f"{schema}.{table_name}", error))
     finally:
-        cursor.close()
+        if owns_cursor:
+            cursor.close()
+
+    return {
+        "total": len(tables),
+        "success": success_count,
+        "failed": len(failed_tables),
+        "failed_tables": failed_tables,
+    }
+
+
+def drop_single_table(
+    connection: trino.dbapi.Connection,
+    schema: str,
+    table_name: str,
+    catalog: str = "dune",
+) -> dict:
+    """
+    Drop one table or view without listing it first.
+
+    DROP ... IF EXISTS is a no-op for a missing object, so no lookup is
+    needed, and a view is handled by the DROP TABLE fallback in
+    drop_table_or_view. This skips the batching and logging of drop_tables.
+
+    Args:
+        connection: Active Trino connection
+        schema: Schema name
+        table_name: Name of the table/view to drop
+        catalog: Catalog name (default: 'dune')
+
+    Returns:
+        dict: Summary with counts of successful and failed drops
+    """
+    error = drop_table_or_view(connection, schema, table_name, catalog=catalog, dry_run=False)
+    if error is None:
+        logger.info(f"✓ Dropped (if it existed): {schema}.{table_name}")
+        return {"total": 1, "success": 1, "failed": 0}
+    log_failures(1, [(f"{schema}.{table_name}", error)])
+    return {"total": 1, "success": 0, "failed": 1}
+
+
+def log_progress(done: int, total: Optional[int], success_count: int, failed_count: int, start_time: float):
+    """Log one progress line for a run of drops (total is None while still listing)."""
+    elapsed = time.perf_counter() - start_time
+    rate = done / elapsed if elapsed > 0 else 0.0
+    total_label = "?" if total is None else total
+    logger.info(f"[{done}/{total_label}] dropped {success_count} success, {failed_count} failed, {rate:.0f}/s")
+
+
+def log_failures(failed_count: int, failed_tables: list):
+    """
+    Log a single error summarizing failed drops.
+
+    Args:
+        failed_count: Total number of failed drops
+        failed_tables: (name, error message) pairs for the first failures;
+            at most MAX_LOGGED_FAILURES are shown
+    """
+    if not failed_count:
+        return
+    lines = [f"✗ Failed to drop {failed_count} table(s)/view(s):"]
+    lines.extend(f"  {name}: {error}" for name, error in failed_tables[:MAX_LOGGED_FAILURES])
+    if failed_count > MAX_LOGGED_FAILURES:
+        lines.append(f"  ... and {failed_count - MAX_LOGGED_FAILURES} more")
+    logger.error("\n".join(lines))
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into consecutive lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def chunked_tables(tables: Iterable[tuple], size: int) -> Iterator[TableList]:
+    """Split (schema, table name) pairs into TableLists of at most `size` tables."""
+    iterator = iter(tables)
+    while chunk := TableList.from_rows(itertools.islice(iterator, size)):
+        yield chunk
 
 
 def drop_tables(
     connection: trino.dbapi.Connection,
-    tables: list,
+    tables: Iterable[tuple],
     catalog: str = "dune",
     dry_run: bool = True,
+    concurrency: int = 1,
+    connection_factory: Optional[Callable[[], trino.dbapi.Connection]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cursor: Optional[trino.dbapi.Cursor] = None,
+    log_every: int = DEFAULT_LOG_EVERY,
 ) -> dict:
     """
-    Drop tables and views from the list.
+    Drop tables and views from an iterable, consuming it as it is produced.
+
+    Tables are split into batches of at most batch_size. Batches run serially
+    over one cursor on the given connection unless concurrency > 1 and a
+    connection_factory is supplied, in which case they are dispatched to a
+    thread pool where each worker reuses its own connection and cursor. Drops
+    can start before every listing query of a multi-query listing has run.
 
     Args:
         connection: Active Trino connection
-        tables: List of table dicts with 'schema', 'name', and 'type'
+        tables: Iterable of (schema, table name) pairs
         catalog: Catalog name (default: 'dune')
         dry_run: If True, only log the commands without executing
+        concurrency: Maximum number of batches to run in parallel
+        connection_factory: Callable returning a new connection for each worker
+        batch_size: Maximum number of drops per batch
+        cursor: Cursor for serial drops (a new one is opened and closed if omitted)
+        log_every: Log progress each time this many more drops have completed
 
     Returns:
         dict: Summary with counts of successful and failed drops
     """
-    if not tables:
+    # Read ahead enough tables to give every worker a full batch. For small
+    # cleanups this holds the whole listing, so batches can be sized to it.
+    tables = iter(tables)
+    read_ahead = batch_size * max(concurrency, 1)
+    head = TableList.from_rows(itertools.islice(tables, read_ahead))
+    if not head:
         logger.info("No tables found to drop.")
         return {"total": 0, "success": 0, "failed": 0}
+    fully_read = len(head) < read_ahead
+    tables = itertools.chain(head, tables)
 
     logger.info("=" * 80)
-    logger.info(f"Preparing to drop {len(tables)} table(s)/view(s)")
+    if fully_read:
+        logger.info(f"Preparing to drop {len(head)} table(s)/view(s)")
+    else:
+        logger.info(f"Preparing to drop {len(head)}+ table(s)/view(s)")
     logger.info("=" * 80)
 
     success_count = 0
     failed_count = 0
+    failed_tables = []
+    total = len(head) if fully_read else None
+    start_time = time.perf_counter()
+    next_progress = log_every
+
+    def record(result: dict):
+        # Called on this thread only, so the counters need no lock
+        nonlocal success_count, failed_count, next_progress
+        success_count += result["success"]
+        failed_count += result["failed"]
+        if len(failed_tables) < MAX_LOGGED_FAILURES:
+            failed_tables.extend(result["failed_tables"][:MAX_LOGGED_FAILURES - len(failed_tables)])
+        done = success_count + failed_count
+        if not dry_run and done >= next_progress:
+            log_progress(done, total, success_count, failed_count, start_time)
+            next_progress = (done // log_every + 1) * log_every
+
+    single_table = fully_read and len(head) == 1
+    if dry_run or concurrency <= 1 or single_table or connection_factory is None:
+        owns_cursor = cursor is None and not dry_run
+        if owns_cursor:
+            cursor = connection.cursor()
+        try:
+            for batch in chunked_tables(tables, batch_size):
+                record(drop_tables_batched(connection, batch, catalog, dry_run, cursor=cursor))
+        finally:
+            if owns_cursor:
+                cursor.close()
+    else:
+        worker_state = threading.local()
+        worker_cursors = []
+        worker_cursors_lock = threading.Lock()
+
+        def drop_in_worker(batch: TableList) -> dict:
+            # Lazily open one connection and cursor per worker thread
+            if not hasattr(worker_state, "cursor"):
+                worker_state.connection = connection_factory()
+                worker_state.cursor = worker_state.connection.cursor()
+                with worker_cursors_lock:
+                    worker_cursors.append(worker_state.cursor)
+            return drop_tables_batched(
+                worker_state.connection,
+                batch,
+                catalog,
+                dry_run,
+                cursor=worker_state.cursor,
+            )
 
-    for table in tables:
-        success = drop_table_or_view(
-            connection,
-            table["schema"],
-            table["name"],
-            table["type"],
-            catalog,
-            dry_run,
-        )
-        if success:
-            success_count += 1
+        # Shrink batches when there are few tables so every worker gets some
+        if fully_read:
+            batch_size = min(batch_size, math.ceil(len(head) / concurrency))
+            max_workers = min(concurrency, math.ceil(len(head) / batch_size))
         else:
-            failed_count += 1
+            max_workers = concurrency
+        logger.info(f"Dropping in batches of up to {batch_size} with {max_workers} concurrent worker(s)")
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Keep only a few batches per worker in flight, so the listing is
+                # consumed as workers free up rather than queued in memory, and
+                # progress is recorded while the listing is still being read
+                max_in_flight = 2 * max_workers
+                pending = set()
+                for batch in chunked_tables(tables, batch_size):
+                    if len(pending) >= max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record(future.result())
+                    pending.add(executor.submit(drop_in_worker, batch))
+                for future in as_completed(pending):
+                    record(future.result())
+        finally:
+            for worker_cursor in worker_cursors:
+                worker_cursor.close()
 
     logger.info("=" * 80)
     logger.info(f"Drop summary: {success_count} successful, {failed_count} failed")
     logger.info("=" * 80)
+    log_failures(failed_count, failed_tables)
 
     return {
-        "total": len(tables),
+        "total": success_count + failed_count,
         "success": success_count,
         "failed": failed_count,
     }
 
 
-def main():
-    """Main entry point for the script."""
+def parse_session_properties(values: Optional[list]) -> dict:
+    """
+    Parse KEY=VALUE strings from --session into a dict of session properties.
+
+    Raises:
+        ValueError: If a value is not of the form KEY=VALUE
+    """
+    session_properties = {}
+    for value in values or []:
+        key, sep, property_value = value.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"--session expects KEY=VALUE, got {value!r}")
+        session_properties[key] = property_value.strip()
+    return session_properties
+
+
+def confirm_prod_drop() -> bool:
+    """Ask the user to type 'yes' before a production drop."""
+    try:
+        response = input("Are you sure you want to proceed? Type 'yes' to confirm: ").strip().lower()
+        if response != "yes":
+            logger.info("Operation cancelled by user.")
+            return False
+        logger.info("Confirmed. Proceeding with drop operations...")
+        return True
+    except (KeyboardInterrupt, EOFError):
+        logger.info("\nOperation cancelled by user.")
+        return False
+
+
+def validate_args(args: argparse.Namespace) -> bool:
+    """
+    Validate and normalize the arguments shared by drop_tables.py and drop_tables_async.py.
+
+    Applies --verbose, clamps --concurrency to MAX_CONCURRENCY, fills in the
+    defaults for --batch-size and --cache-ttl (left as None by the parser so
+    callers can tell whether they were given), and sets args.schema_names
+    (the --schemas list, or None) and args.session_properties (parsed
+    --session values). The first invalid argument is logged.
+
+    Args:
+        args: Parsed arguments from build_parser()
+
+    Returns:
+        bool: True if the arguments are valid
+    """
+    # Set logging level based on verbose flag
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.setLevel(logging.DEBUG)
+
+    if args.concurrency < 1:
+        logger.error("Error: --concurrency must be at least 1")
+        return False
+    if args.concurrency > MAX_CONCURRENCY:
+        logger.warning(f"--concurrency {args.concurrency} exceeds maximum, using {MAX_CONCURRENCY}")
+        args.concurrency = MAX_CONCURRENCY
+    if args.batch_size is None:
+        args.batch_size = DEFAULT_BATCH_SIZE
+    if args.cache_ttl is None:
+        args.cache_ttl = DEFAULT_CACHE_TTL
+    if args.batch_size < 1:
+        logger.error("Error: --batch-size must be at least 1")
+        return False
+    if args.log_every < 1:
+        logger.error("Error: --log-every must be at least 1")
+        return False
+    try:
+        args.session_properties = parse_session_properties(args.session)
+    except ValueError as e:
+        logger.error(f"Error: {e}")
+        return False
+
+    if args.table and not args.schema:
+        logger.error("Error: --table requires --schema to be specified")
+        return False
+    if args.verify and not args.table:
+        logger.error("Error: --verify can only be used with --table")
+        return False
+    args.schema_names = None
+    if args.schemas is not None:
+        if args.schema:
+            logger.error("Error: --schemas cannot be combined with --schema")
+            return False
+        args.schema_names = [schema.strip() for schema in args.schemas.split(",") if schema.strip()]
+        if not args.schema_names:
+            logger.error("Error: --schemas requires at least one schema name")
+            return False
+
+    return True
+
+
+def log_dry_run_complete():
+    """Log the closing banner for a dry run."""
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info("DRY RUN COMPLETE")
+    logger.info("Above are the DROP commands that would be executed.")
+    logger.info("Use --execute flag to actually drop the tables/views.")
+    logger.info("=" * 80)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Drop tables and views in a Dune schema via Trino API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -429,6 +1156,9 @@ Examples:
   # Execute drop for dev tables
   python scripts/drop_tables.py --execute
 
+  # Drop all tables in several dev schemas (dry run)
+  python scripts/drop_tables.py --schemas dune__tmp_jeff,dune__tmp_pr123
+
   # Drop specific dev table (dry run)
   python scripts/drop_tables.py --table my_table --schema dune__tmp_jeff
 
@@ -443,11 +1173,6 @@ Examples:
         """,
     )
 
-    # Get default schema pattern from environment
-    dune_team_name = os.getenv("DUNE_TEAM_NAME", "dune")
-    default_dev_pattern = f"{dune_team_name}__tmp_%"
-    default_prod_schema = dune_team_name
-
     parser.add_argument(
         "--target",
         type=str,
@@ -463,6 +1188,13 @@ Examples:
         help="Schema name or pattern (overrides --target default)",
     )
 
+    parser.add_argument(
+        "--schemas",
+        type=str,
+        default=None,
+        help="Comma-separated list of exact schema names (alternative to --schema)",
+    )
+
     parser.add_argument(
         "--table",
         type=str,
@@ -470,12 +1202,60 @@ Examples:
         help="Specific table or view name to drop (requires --schema to be exact schema name)",
     )
 
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="With --table, check that the table exists before dropping it (costs one query; connects even in a dry run)",
+    )
+
     parser.add_argument(
         "--execute",
         action="store_true",
         help="Execute the drop operations (default is dry-run mode)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of drops to run in parallel (default: {DEFAULT_CONCURRENCY}, max: {MAX_CONCURRENCY})",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Number of drops handed to a worker at a time (default: {DEFAULT_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--log-every",
+        type=int,
+        default=DEFAULT_LOG_EVERY,
+        help=f"Log progress every N drops; individual drops are logged with --verbose (default: {DEFAULT_LOG_EVERY})",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=None,
+        help=f"Seconds to reuse a cached listing of the same --schemas (default: {DEFAULT_CACHE_TTL})",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Trino for the --schemas listing instead of using the cache",
+    )
+
+    parser.add_argument(
+        "--session",
+        action="append",
+        metavar="KEY=VALUE",
+        default=None,
+        help="Trino session property for every connection (repeatable, e.g. --session query_max_run_time=10m)",
+    )
+
     parser.add_argument(
         "--api-key",
         type=str,
@@ -490,12 +1270,29 @@ Examples:
         help="Enable verbose (debug) logging",
     )
 
-    args = parser.parse_args()
+    return parser
 
-    # Set logging level based on verbose flag
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-        logger.setLevel(logging.DEBUG)
+
+def main(args: Optional[argparse.Namespace] = None):
+    """
+    Main entry point for the script.
+
+    Args:
+        args: Parsed arguments (parsed from the command line if omitted)
+    """
+    parser = build_parser()
+
+    # Get default schema pattern from environment
+    dune_team_name = os.getenv("DUNE_TEAM_NAME", "dune")
+    default_dev_pattern = f"{dune_team_name}__tmp_%"
+    default_prod_schema = dune_team_name
+
+    if args is None:
+        args = parser.parse_args()
+    if not validate_args(args):
+        return 1
+    schemas = args.schema_names
+    session_properties = args.session_properties
 
     # Determine dry run mode
     dry_run = not args.execute
@@ -515,11 +1312,6 @@ Examples:
             schema_or_pattern = default_dev_pattern
             use_pattern = True
 
-    # Validation
-    if args.table and not args.schema:
-        logger.error("Error: --table requires --schema to be specified")
-        return 1
-    
     # Production safety: require specific table/view
     if is_prod and (not args.schema or not args.table):
         logger.error("=" * 80)
@@ -546,30 +1338,83 @@ Examples:
     target_label = f"{'PROD' if is_prod else 'DEV'}"
     if args.table:
         logger.info(f"Target [{target_label}]: Specific table '{args.table}' in schema '{args.schema}'")
+    elif schemas:
+        logger.info(f"Target [{target_label}]: All tables in schemas {', '.join(repr(schema) for schema in schemas)}")
     elif use_pattern:
         logger.info(f"Target [{target_label}]: All tables matching schema pattern '{schema_or_pattern}'")
     else:
         logger.info(f"Target [{target_label}]: All tables in schema '{schema_or_pattern}'")
 
+    # A dry run for a specific table needs nothing from Trino, so print the
+    # statements without connecting, unless --verify asks for the lookup
+    if dry_run and args.table and not args.verify:
+        try:
+            quoted_names = (
+                quote_identifier("dune"),
+                quote_identifier(args.schema),
+                quote_identifier(args.table),
+            )
+        except ValueError as e:
+            logger.error(f"Error: {e}")
+            return 1
+
+        logger.info("Not connecting to Trino for a single-table dry run; existence is not checked")
+        logger.info(f"DROP: {DROP_TABLE_TEMPLATE.format(*quoted_names)}")
+        logger.info(f"  If the object is a view: {DROP_VIEW_TEMPLATE.format(*quoted_names)}")
+        logger.info(f"  If the object is a materialized view: {DROP_MATERIALIZED_VIEW_TEMPLATE.format(*quoted_names)}")
+        log_dry_run_complete()
+        return 0
+
+    # A single table is dropped directly unless --verify asks for a lookup.
+    # There is nothing to preview, so prod only asks for confirmation.
+    single_table = args.table and not args.verify
+    if single_table and is_prod:
+        logger.warning("")
+        logger.warning("=" * 80)
+        logger.warning("⚠️  PRODUCTION DROP WARNING ⚠️")
+        logger.warning("=" * 80)
+        logger.warning(f"You are about to DROP '{args.schema}.{args.table}' from PRODUCTION (if it exists)!")
+        logger.warning("=" * 80)
+        logger.warning("")
+        if not confirm_prod_drop():
+            return 0
+
     # Execute
     dune_conn = None
     try:
         # Create connection
-        dune_conn = DuneTrinoConnection(api_key=args.api_key)
+        dune_conn = DuneTrinoConnection(
+            api_key=args.api_key,
+            extra_session_properties=session_properties,
+        )
         connection = dune_conn.connect()
 
-        # Get tables to drop
+        if single_table:
+            summary = drop_single_table(connection, args.schema, args.table, catalog="dune")
+            if summary["success"]:
+                invalidate_cached_tables("dune")
+            return 0
+
+        # Get tables to drop; listings are fed to drop_tables lazily, one query at a time
         if args.table:
             # Drop specific table
-            tables = list_specific_table(
+            tables = TableList.from_rows(list_specific_table(
                 connection,
                 args.schema,
                 args.table,
                 catalog="dune",
-            )
+            ))
             if not tables:
                 logger.warning(f"Table '{args.table}' not found in schema '{args.schema}'")
                 return 0
+        elif schemas:
+            # Drop all in the listed schemas (uses exact IN match)
+            tables = list_tables_multi(
+                connection,
+                schemas,
+                catalog="dune",
+                cache_ttl=None if args.no_cache else args.cache_ttl,
+            )
         elif use_pattern:
             # Drop by pattern (uses SQL LIKE with wildcards)
             tables = list_tables_by_pattern(
@@ -586,34 +1431,37 @@ Examples:
             )
 
         # Production safety check: require confirmation before dropping
-        if is_prod and not dry_run and tables:
+        preview = []
+        if is_prod and not dry_run:
+            # Read one past the preview so we know whether more tables follow,
+            # then put the preview back in front of the rest of the stream
+            tables = iter(tables)
+            preview = list(itertools.islice(tables, PREVIEW_COUNT + 1))
+            tables = itertools.chain(preview, tables)
+        if preview:
+            has_more = len(preview) > PREVIEW_COUNT
+            preview = preview[:PREVIEW_COUNT]
+            total_label = f"more than {len(preview)}" if has_more else f"{len(preview)}"
+
             logger.warning("")
             logger.warning("=" * 80)
             logger.warning("⚠️  PRODUCTION DROP WARNING ⚠️")
             logger.warning("=" * 80)
-            logger.warning(f"You are about to DROP {len(tables)} table(s)/view(s) from PRODUCTION schema(s)!")
+            logger.warning(f"You are about to DROP {total_label} table(s)/view(s) from PRODUCTION schema(s)!")
             logger.warning(f"Schema: {schema_or_pattern}")
             logger.warning("=" * 80)
             logger.warning("")
             
             # Show first 10 tables as preview
-            preview_count = min(10, len(tables))
-            logger.warning(f"Preview of tables to be dropped (showing {preview_count} of {len(tables)}):")
-            for i, table in enumerate(tables[:preview_count]):
-                logger.warning(f"  {i+1}. {table['schema']}.{table['name']} ({table['type']})")
-            if len(tables) > preview_count:
-                logger.warning(f"  ... and {len(tables) - preview_count} more table(s)")
+            logger.warning(f"Preview of tables to be dropped (showing {len(preview)} of {total_label}):")
+            for i, (schema, table_name) in enumerate(preview):
+                logger.warning(f"  {i+1}. {schema}.{table_name}")
+            if has_more:
+                logger.warning("  ... and more table(s)")
             logger.warning("")
             
             # Get user confirmation
-            try:
-                response = input("Are you sure you want to proceed? Type 'yes' to confirm: ").strip().lower()
-                if response != "yes":
-                    logger.info("Operation cancelled by user.")
-                    return 0
-                logger.info("Confirmed. Proceeding with drop operations...")
-            except (KeyboardInterrupt, EOFError):
-                logger.info("\nOperation cancelled by user.")
+            if not confirm_prod_drop():
                 return 0
 
         # Drop the tables
@@ -622,15 +1470,18 @@ Examples:
             tables,
             catalog="dune",
             dry_run=dry_run,
+            concurrency=args.concurrency,
+            connection_factory=dune_conn.new_connection,
+            batch_size=args.batch_size,
+            log_every=args.log_every,
         )
 
+        # Cached listings are stale once anything was dropped
+        if not dry_run and summary["success"]:
+            invalidate_cached_tables("dune")
+
         if dry_run:
-            logger.info("")
-            logger.info("=" * 80)
-            logger.info("DRY RUN COMPLETE")
-            logger.info("Above are the DROP commands that would be executed.")
-            logger.info("Use --execute flag to actually drop the tables/views.")
-            logger.info("=" * 80)
+            log_dry_run_complete()
 
         return 0
 
@@ -643,6 +1494,16 @@ Examples:
             dune_conn.close()
 
 
+def configure_logging():
+    """Configure root logging for command-line use."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
 if __name__ == "__main__":
+    configure_logging()
     sys.exit(main())
 
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Async variant of drop_tables.py that pipelines listing and dropping.
+
+Table names are streamed from the listing query into a queue and dropped by
+a fixed pool of workers as they arrive, so the first drops start while the
+listing is still being read. The queue is unbounded so that reading the
+listing never waits on the drops; otherwise a slow cleanup could stall page
+fetches long enough for Trino to abandon the listing query. Each worker holds its own connection,
+and the number of workers is the concurrency limit.
+
+Requires the optional aiotrino package (`uv pip install aiotrino`). When it is
+not installed, or for dry runs, single-table and prod drops, this delegates to
+drop_tables.py with the same arguments. The pipelined path validates arguments
+like drop_tables.py, but has no batches and never reads the listing cache, so
+it rejects --batch-size and --cache-ttl (--no-cache is always in effect).
+
+Usage:
+    # Execute drops for all dev tables with 16 concurrent workers
+    python scripts/drop_tables_async.py --execute --concurrency 16
+
+    # Execute drops for a list of schemas
+    python scripts/drop_tables_async.py --schemas dune__tmp_jeff,dune__tmp_pr123 --execute
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Optional
+
+import drop_tables
+from drop_tables import (
+    DEFAULT_LOG_EVERY,
+    DROP_TABLE_TEMPLATE,
+    LIST_SCHEMAS_QUERY,
+    MAX_LOGGED_FAILURES,
+    MAX_SCHEMAS_PER_QUERY,
+    REQUEST_TIMEOUT,
+    RETRYABLE_ERROR_NAMES,
+    DuneTrinoConnection,
+    build_list_tables_query,
+    chunked,
+    log_failures,
+    log_progress,
+    quote_identifier,
+    quote_identifier_cached,
+    view_fallback_template,
+)
+
+# aiotrino is optional and, like trino, slow to import, so only check that it
+# is installed in main() and import it where it is used
+if TYPE_CHECKING:
+    import aiotrino
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling a worker that the listing is finished
+_DONE = None
+
+
+def connect_async(dune_conn: DuneTrinoConnection) -> aiotrino.dbapi.Connection:
+    """
+    Open an aiotrino connection with the same configuration as drop_tables.py.
+
+    Args:
+        dune_conn: Connection config (host, port, catalog, API key)
+
+    Returns:
+        aiotrino.dbapi.Connection: Async Trino connection
+    """
+    import aiotrino
+
+    return aiotrino.dbapi.connect(
+        host=dune_conn.host,
+        port=dune_conn.port,
+        user="dune",  # Always 'dune' for Dune API
+        catalog=dune_conn.catalog,
+        http_scheme="https",
+        auth=aiotrino.auth.BasicAuthentication("dune", dune_conn.api_key),
+        session_properties=dune_conn.session_properties,
+        request_timeout=REQUEST_TIMEOUT[1],
+    )
+
+
+async def execute_with_retry(cursor, sql: str, params: Optional[tuple] = None, fetch: bool = True) -> Optional[list]:
+    """
+    Async counterpart of drop_tables.execute_with_retry.
+
+    Reissues the statement once if it fails with a transient Trino error.
+
+    Args:
+        cursor: aiotrino cursor to execute on
+        sql: SQL statement
+        params: Query parameters, if any
+        fetch: If False, leave the results on the cursor for the caller to iterate
+
+    Returns:
+        list: All result rows, or None if fetch is False
+    """
+    import aiotrino
+
+    try:
+        await cursor.execute(sql, params)
+        return await cursor.fetchall() if fetch else None
+    except aiotrino.exceptions.TrinoQueryError as e:
+        if e.error_name not in RETRYABLE_ERROR_NAMES:
+            raise
+        logger.warning(f"Transient error, retrying once: {e}")
+        await cursor.execute(sql, params)
+        return await cursor.fetchall() if fetch else None
+
+
+async def list_tables_into_queue(
+    dune_conn: DuneTrinoConnection,
+    queue: asyncio.Queue,
+    worker_count: int,
+    schema_pattern: Optional[str] = None,
+    schemas: Optional[list] = None,
+    catalog: str = "dune",
+):
+    """
+    Stream tables matching a schema pattern or list of schemas into the queue.
+
+    A pattern is first resolved to exact schema names, as in drop_tables.py.
+    One sentinel per worker is queued at the end, even if the listing fails.
+
+    Args:
+        dune_conn: Connection config
+        queue: Queue receiving (schema, table name) tuples
+        worker_count: Number of workers to signal when the listing is done
+        schema_pattern: Schema pattern to match (e.g., 'my_team__tmp_%')
+        schemas: Exact schema names, used when no pattern is given
+        catalog: Catalog name (default: 'dune')
+    """
+    connection = connect_async(dune_conn)
+    try:
+        cursor = await connection.cursor()
+        if schema_pattern is not None:
+            logger.info(f"Querying schemas matching pattern: {schema_pattern}")
+            rows = await execute_with_retry(cursor, LIST_SCHEMAS_QUERY, (catalog, schema_pattern))
+            schemas = [row[0] for row in rows]
+            logger.info(f"Schema pattern {schema_pattern} matched {len(schemas)} schema(s)")
+
+        start_time = time.perf_counter()
+        row_count = 0
+        for schema_chunk in chunked(schemas, MAX_SCHEMAS_PER_QUERY):
+            query, params = build_list_tables_query(catalog=catalog, schema_in=schema_chunk)
+            await execute_with_retry(cursor, query, params, fetch=False)
+            async for schema_name, table_name in cursor:
+                row_count += 1
+                # Never blocks, so the next page is fetched as soon as it is ready
+                queue.put_nowait((schema_name, table_name))
+        logger.debug(f"Listed {row_count} table(s) in {time.perf_counter() - start_time:.2f}s")
+    finally:
+        for _ in range(worker_count):
+            queue.put_nowait(_DONE)
+        await connection.close()
+
+
+async def drop_from_queue(
+    dune_conn: DuneTrinoConnection,
+    queue: asyncio.Queue,
+    counts: dict,
+    catalog: str = "dune",
+    log_every: int = DEFAULT_LOG_EVERY,
+):
+    """
+    Drop tables taken from the queue until a sentinel is received.
+
+    Issues DROP TABLE and retries as DROP VIEW or DROP MATERIALIZED VIEW when
+    Trino reports that the object is one, as drop_table_or_view does.
+
+    Args:
+        dune_conn: Connection config
+        queue: Queue of (schema, table name) tuples
+        counts: Dict with 'success', 'failed', 'failed_tables' and 'start_time' to update
+        catalog: Catalog name (default: 'dune')
+        log_every: Log progress each time this many more drops have completed
+    """
+    import aiotrino
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    connection = connect_async(dune_conn)
+    try:
+        cursor = await connection.cursor()
+        while (item := await queue.get()) is not _DONE:
+            schema, table_name = item
+            try:
+                quoted_names = (
+                    quote_identifier_cached(catalog),
+                    quote_identifier_cached(schema),
+                    quote_identifier(table_name),
+                )
+                drop_statement = DROP_TABLE_TEMPLATE.format(*quoted_names)
+                if debug_enabled:
+                    logger.debug(f"DROP: {drop_statement}")
+                try:
+                    await execute_with_retry(cursor, drop_statement)
+                except aiotrino.exceptions.TrinoUserError as e:
+                    fallback_template = view_fallback_template(e.message)
+                    if fallback_template is None:
+                        raise
+                    drop_statement = fallback_template.format(*quoted_names)
+                    if debug_enabled:
+                        logger.debug(f"DROP: {drop_statement}")
+                    await execute_with_retry(cursor, drop_statement)
+                if debug_enabled:
+                    logger.debug(f"✓ Successfully dropped: {schema}.{table_name}")
+                # Workers share one event loop thread, so no lock is needed
+                counts["success"] += 1
+            except Exception as e:
+                if debug_enabled:
+                    logger.debug(f"✗ Error dropping {schema}.{table_name}: {e}")
+                counts["failed"] += 1
+                if len(counts["failed_tables"]) < MAX_LOGGED_FAILURES:
+                    counts["failed_tables"].append((f"{schema}.{table_name}", str(e)))
+            done = counts["success"] + counts["failed"]
+            if done % log_every == 0:
+                log_progress(done, None, counts["success"], counts["failed"], counts["start_time"])
+    finally:
+        await connection.close()
+
+
+async def drop_tables_pipelined(
+    dune_conn: DuneTrinoConnection,
+    concurrency: int,
+    schema_pattern: Optional[str] = None,
+    schemas: Optional[list] = None,
+    catalog: str = "dune",
+    log_every: int = DEFAULT_LOG_EVERY,
+) -> dict:
+    """
+    List and drop tables concurrently.
+
+    Args:
+        dune_conn: Connection config
+        concurrency: Number of drop workers
+        schema_pattern: Schema pattern to match (e.g., 'my_team__tmp_%')
+        schemas: Exact schema names, used when no pattern is given
+        catalog: Catalog name (default: 'dune')
+        log_every: Log progress each time this many more drops have completed
+
+    Returns:
+        dict: Summary with counts of successful and failed drops
+    """
+    # Unbounded, since rows are two short strings and a bound would pace the
+    # listing query to the drops
+    queue = asyncio.Queue()
+    counts = {"success": 0, "failed": 0, "failed_tables": [], "start_time": time.perf_counter()}
+
+    logger.info("=" * 80)
+    logger.info(f"Dropping tables/views as they are listed with {concurrency} concurrent worker(s)")
+    logger.info("=" * 80)
+
+    await asyncio.gather(
+        list_tables_into_queue(dune_conn, queue, concurrency, schema_pattern, schemas, catalog),
+        *(drop_from_queue(dune_conn, queue, counts, catalog, log_every) for _ in range(concurrency)),
+    )
+
+    if counts["success"] + counts["failed"] == 0:
+        logger.info("No tables found to drop.")
+    logger.info("=" * 80)
+    logger.info(f"Drop summary: {counts['success']} successful, {counts['failed']} failed")
+    logger.info("=" * 80)
+    log_failures(counts["failed"], counts["failed_tables"])
+
+    return {
+        "total": counts["success"] + counts["failed"],
+        "success": counts["success"],
+        "failed": counts["failed"],
+    }
+
+
+def main():
+    """Main entry point for the script."""
+    if importlib.util.find_spec("aiotrino") is None:
+        logger.warning("aiotrino is not installed; falling back to drop_tables.py")
+        return drop_tables.main()
+
+    args = drop_tables.build_parser().parse_args()
+
+    # Dry runs and single-table drops gain nothing from pipelining, and prod
+    # drops need the interactive checks in drop_tables.py
+    if not args.execute or args.table or args.target == "prod":
+        return drop_tables.main(args)
+
+    # The pipeline drops tables one at a time as they are listed and always
+    # queries the listing, so these options have nothing to apply to. Checked
+    # before validate_args, which fills in their defaults.
+    if args.batch_size is not None:
+        logger.error("Error: --batch-size is not supported by drop_tables_async.py")
+        return 1
+    if args.cache_ttl is not None:
+        logger.error("Error: --cache-ttl is not supported by drop_tables_async.py (the listing is never cached)")
+        return 1
+    if not drop_tables.validate_args(args):
+        return 1
+
+    schemas = args.schema_names
+    schema_pattern = None
+    if schemas is not None:
+        logger.info(f"Target [DEV]: All tables in schemas {', '.join(repr(schema) for schema in schemas)}")
+    else:
+        schema_pattern = args.schema or f"{os.getenv('DUNE_TEAM_NAME', 'dune')}__tmp_%"
+        logger.info(f"Target [DEV]: All tables matching schema pattern '{schema_pattern}'")
+
+    try:
+        dune_conn = DuneTrinoConnection(
+            api_key=args.api_key,
+            extra_session_properties=args.session_properties,
+        )
+        summary = asyncio.run(
+            drop_tables_pipelined(
+                dune_conn, args.concurrency, schema_pattern, schemas, catalog="dune", log_every=args.log_every
+            )
+        )
+    except Exception as e:
+        logger.error(f"Failed to complete operation: {e}")
+        return 1
+
+    # Cached listings are stale once anything was dropped
+    if summary["success"]:
+        drop_tables.invalidate_cached_tables("dune")
+
+    return 0
+
+
+if __name__ == "__main__":
+    drop_tables.configure_logging()
+    sys.exit(main())